@@ -31,6 +31,8 @@ Note:
 For more detailed documentation on the use of this module and the Python CUBRID API,
 refer to the official CUBRID documentation and Python API guidelines.
 """
+import re
+
 from datetime import date, time, datetime
 from decimal import Decimal
 
@@ -41,6 +43,10 @@ from .exceptions import InterfaceError
 INT_MIN = -2147483648
 INT_MAX = +2147483647
 
+# Statements that may change the schema; they are never worth caching as
+# a prepared query and they invalidate any plan prepared before them.
+_DDL_PATTERN = re.compile(r'\b(create|alter|drop|truncate)\b', re.IGNORECASE)
+
 
 def is_iterable(obj):
     """Returns whether an object is iterable"""
@@ -142,6 +148,7 @@ class BaseCursor:
         self.arraysize = 1
         self.rowcount = -1
         self.description = None
+        self._prepared_query = None
 
         self.charset = conn.charset
         self._cs.set_charset(conn.charset)
@@ -169,8 +176,21 @@ class BaseCursor:
         if isinstance(query, (bytes, bytearray)):
             query = query.decode()
 
+        if query == self._prepared_query:
+            # The statement is already prepared on this cursor's request
+            # handle; re-executing only needs fresh parameter binds.
+            return
+
+        # Forget the cached statement before preparing: the C layer resets
+        # the request handle first, so a failed prepare leaves nothing
+        # prepared and the cache must not claim otherwise.
+        self._prepared_query = None
         self._cs.prepare(query)
 
+        # Remember only schema-neutral statements: DDL has no reuse value
+        # and invalidates whatever plan was cached before it.
+        self._prepared_query = None if _DDL_PATTERN.search(query) else query
+
     def _bind_params(self, args):
         """
         Bind parameters to a command statement in a database cursor.
@@ -303,16 +323,12 @@ class BaseCursor:
         return self._cs.fetch_row(self._get_fetch_type())
 
     def _fetch_many(self, size):
+        # Collect the rows in a single C call instead of one fetch_row
+        # call per row; a negative size means the rest of the result set
         self.__check_state()
-        rlist = []
-        i = 0
-        while size < 0 or i < size:
-            r = self.fetchone()
-            if not r:
-                break
-            rlist.append(r)
-            i = i+1
-        return rlist
+        if size < 0:
+            return self._cs.fetch_all_rows(self._get_fetch_type())
+        return self._cs.fetch_many_rows(size, self._get_fetch_type())
 
     def fetchmany(self, size=None):
         """
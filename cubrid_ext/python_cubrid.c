@@ -22,7 +22,9 @@
 
 #define CUBRID_CLOB 'C'
 #define CUBRID_BLOB 'B'
-#define CUBRID_LOB_BUF_SIZE 4096
+/* 64 KiB chunks for LOB import/export: large enough to keep the
+ * syscall and CCI round-trip count low, small enough for the stack. */
+#define CUBRID_LOB_BUF_SIZE 65536
 #define CUBRID_ER_MSG_LEN 1024
 #define CUBRID_ER_MSG_LEN2 1152
 
@@ -2768,6 +2770,203 @@ _cubrid_CursorObject_fetch (_cubrid_CursorObject * self, PyObject * args)
   return row;
 }
 
+static char _cubrid_CursorObject_fetch_all__doc__[] = "fetch_all_rows()\n\
+get all remaining rows from the query result in a single call,\n\
+returned as a list. Walking the result set in C avoids one Python\n\
+method call per row.\n\
+\n\
+Example::\n\
+  import _cubrid\n\
+  con = _cubrid.connect('CUBRID:localhost:33000:demodb:::', 'public')\n\
+  cur = con.cursor()\n\
+  cur.prepare('select * from test_cubrid')\n\
+  cur.execute()\n\
+  rows = cur.fetch_all_rows()\n\
+  cur.close()\n\
+  con.close()";
+
+static PyObject *
+_cubrid_CursorObject_fetch_all (_cubrid_CursorObject * self, PyObject * args)
+{
+  int res, how = 0;
+  T_CCI_ERROR error;
+  PyObject *rows, *row;
+
+  if (self->state == CURSOR_STATE_CLOSED)
+    {
+      return handle_error (CUBRID_ER_INVALID_CURSOR, NULL);
+    }
+  if (!PyArg_ParseTuple (args, "|i", &how))
+    {
+      return NULL;
+    }
+
+  if (how < 0 || how > 1)
+    {
+      return handle_error (CUBRID_ER_INVALID_PARAM, NULL);
+    }
+
+  rows = PyList_New (0);
+  if (rows == NULL)
+    {
+      return NULL;
+    }
+
+  while (1)
+    {
+      res = cci_cursor (self->handle, 0, CCI_CURSOR_CURRENT, &error);
+      if (res == CCI_ER_NO_MORE_DATA)
+        {
+          break;
+        }
+      else if (res < 0)
+        {
+          Py_DECREF (rows);
+          return handle_error (res, &error);
+        }
+
+      res = cci_fetch (self->handle, &error);
+      if (res < 0)
+        {
+          Py_DECREF (rows);
+          return handle_error (res, &error);
+        }
+
+      if (how == 0)
+        {
+          row = _cubrid_row_to_tuple (self);
+        }
+      else
+        {
+          row = _cubrid_row_to_dict (self);
+        }
+
+      if (row == NULL)
+        {
+          Py_DECREF (rows);
+          return NULL;
+        }
+
+      if (PyList_Append (rows, row) < 0)
+        {
+          Py_DECREF (row);
+          Py_DECREF (rows);
+          return NULL;
+        }
+      Py_DECREF (row);
+
+      res = cci_cursor (self->handle, 1, CCI_CURSOR_CURRENT, &error);
+      if (res < 0 && res != CCI_ER_NO_MORE_DATA)
+        {
+          Py_DECREF (rows);
+          return handle_error (res, &error);
+        }
+
+      self->cursor_pos += 1;
+    }
+
+  return rows;
+}
+
+static char _cubrid_CursorObject_fetch_many__doc__[] = "fetch_many_rows(size[, how])\n\
+get up to size rows from the query result in a single call, returned\n\
+as a list. Fewer rows are returned when the result set runs out. Like\n\
+fetch_all_rows, the per-row work happens in C instead of one Python\n\
+call per row.\n\
+\n\
+Example::\n\
+  import _cubrid\n\
+  con = _cubrid.connect('CUBRID:localhost:33000:demodb:::', 'public')\n\
+  cur = con.cursor()\n\
+  cur.prepare('select * from test_cubrid')\n\
+  cur.execute()\n\
+  rows = cur.fetch_many_rows(10)\n\
+  cur.close()\n\
+  con.close()";
+
+static PyObject *
+_cubrid_CursorObject_fetch_many (_cubrid_CursorObject * self, PyObject * args)
+{
+  int res, size = 0, how = 0, fetched;
+  T_CCI_ERROR error;
+  PyObject *rows, *row;
+
+  if (self->state == CURSOR_STATE_CLOSED)
+    {
+      return handle_error (CUBRID_ER_INVALID_CURSOR, NULL);
+    }
+  if (!PyArg_ParseTuple (args, "i|i", &size, &how))
+    {
+      return NULL;
+    }
+
+  if (size < 0 || how < 0 || how > 1)
+    {
+      return handle_error (CUBRID_ER_INVALID_PARAM, NULL);
+    }
+
+  rows = PyList_New (0);
+  if (rows == NULL)
+    {
+      return NULL;
+    }
+
+  for (fetched = 0; fetched < size; fetched++)
+    {
+      res = cci_cursor (self->handle, 0, CCI_CURSOR_CURRENT, &error);
+      if (res == CCI_ER_NO_MORE_DATA)
+        {
+          break;
+        }
+      else if (res < 0)
+        {
+          Py_DECREF (rows);
+          return handle_error (res, &error);
+        }
+
+      res = cci_fetch (self->handle, &error);
+      if (res < 0)
+        {
+          Py_DECREF (rows);
+          return handle_error (res, &error);
+        }
+
+      if (how == 0)
+        {
+          row = _cubrid_row_to_tuple (self);
+        }
+      else
+        {
+          row = _cubrid_row_to_dict (self);
+        }
+
+      if (row == NULL)
+        {
+          Py_DECREF (rows);
+          return NULL;
+        }
+
+      if (PyList_Append (rows, row) < 0)
+        {
+          Py_DECREF (row);
+          Py_DECREF (rows);
+          return NULL;
+        }
+      Py_DECREF (row);
+
+      res = cci_cursor (self->handle, 1, CCI_CURSOR_CURRENT, &error);
+      if (res < 0 && res != CCI_ER_NO_MORE_DATA)
+        {
+          Py_DECREF (rows);
+          return handle_error (res, &error);
+        }
+
+      self->cursor_pos += 1;
+    }
+
+  return rows;
+}
+
 static char _cubrid_CursorObject_fetch_lob__doc__[] = "fetch_lob(col, lob)\n\
 get BLOB/CLOB data out from the database server. You need to specify\n\
 which column is lob type.\n\
@@ -3402,6 +3601,70 @@ _cubrid_LobObject_write (_cubrid_LobObject * self, PyObject * args)
   return Py_None;
 }
 
+static char _cubrid_LobObject_write_bytes__doc__[] = "write_bytes(data[, type])\n\
+writes a bytes-like object to the large object in one call, without\n\
+going through a file or a text decode. If the LOB object does not\n\
+exist, a BLOB object is created by default.\n\
+\n\
+Example::\n\
+  import _cubrid\n\
+  con = _cubrid.connect('CUBRID:localhost:33000:demodb:::', 'public')\n\
+  cur = con.cursor()\n\
+  cur.prepare('insert into test_blob values (?)')\n\
+  lob = con.lob()\n\
+  lob.write_bytes(b'\\x89PNG...')\n\
+  cur.bind_lob(1, lob)\n\
+  cur.execute()\n\
+  lob.close()\n\
+  cur.close()\n\
+  con.close()";
+
+static PyObject *
+_cubrid_LobObject_write_bytes (_cubrid_LobObject * self, PyObject * args)
+{
+  Py_buffer data;
+  char *type = NULL;
+  int res;
+  T_CCI_ERROR error;
+
+  if (!PyArg_ParseTuple (args, "y*|s", &data, &type))
+    {
+      return NULL;
+    }
+
+  if (self->blob == NULL && self->clob == NULL)
+    {
+      if (type == NULL)
+        {
+          _cubrid_LobObject_create (self, CUBRID_BLOB);
+        }
+      else
+        {
+          if (strlen (type) > 1)
+            {
+              PyBuffer_Release (&data);
+              return handle_error (CUBRID_ER_INVALID_PARAM, NULL);
+            }
+
+          _cubrid_LobObject_create (self, *type);
+        }
+    }
+
+  res = _cubrid_LobObject_cci_write (self, self->pos, (int) data.len,
+                                     (char *) data.buf, &error);
+  if (res < 0)
+    {
+      PyBuffer_Release (&data);
+      return handle_error (res, &error);
+    }
+
+  self->pos += data.len;
+  PyBuffer_Release (&data);
+
+  Py_INCREF (Py_None);
+  return Py_None;
+}
+
 static int
 _cubrid_LobObject_cci_read (_cubrid_LobObject * self, CUBRID_LONG_LONG pos,
                             int size, char *buf, T_CCI_ERROR * error)
@@ -3915,6 +4178,11 @@ static PyMethodDef _cubrid_LobObject_methods[] = {
    (PyCFunction) _cubrid_LobObject_write,
    METH_VARARGS,
    _cubrid_LobObject_write__doc__},
+  {
+   "write_bytes",
+   (PyCFunction) _cubrid_LobObject_write_bytes,
+   METH_VARARGS,
+   _cubrid_LobObject_write_bytes__doc__},
   {
    "read",
    (PyCFunction) _cubrid_LobObject_read,
@@ -4025,6 +4293,16 @@ static PyMethodDef _cubrid_CursorObject_methods[] = {
    (PyCFunction) _cubrid_CursorObject_fetch,
    METH_VARARGS,
    _cubrid_CursorObject_fetch__doc__},
+  {
+   "fetch_all_rows",
+   (PyCFunction) _cubrid_CursorObject_fetch_all,
+   METH_VARARGS,
+   _cubrid_CursorObject_fetch_all__doc__},
+  {
+   "fetch_many_rows",
+   (PyCFunction) _cubrid_CursorObject_fetch_many,
+   METH_VARARGS,
+   _cubrid_CursorObject_fetch_many__doc__},
   {
    "fetch_lob",
    (PyCFunction) _cubrid_CursorObject_fetch_lob,
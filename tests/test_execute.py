@@ -12,6 +12,17 @@ from conftest import (
 import cubrid_db
 
 
+# Compiled once at import instead of rebuilt per call through the
+# re module's internal cache lookup
+_VERSION_RE = re.compile(r'[0-9]+\.[0-9]+\.[0-9]+\.[0-9]{4}')
+
+
+# Names of the tables some tests create inline, built once at import
+SCTB_TABLE = f'{TABLE_PREFIX}sctb'
+HI_TABLE = f'{TABLE_PREFIX}hi'
+TT1_TABLE = f'{TABLE_PREFIX}tt1'
+
+
 def test_execute(cubrid_db_cursor, booze_table):
     cur, _ = cubrid_db_cursor
 
@@ -29,11 +40,7 @@ def test_execute(cubrid_db_cursor, booze_table):
     cur.execute(f'select name from {booze_table}')
     res = cur.fetchall()
     assert len(res) == 2, 'cursor.fetchall returned incorrect number of rows'
-    beers = [res[0][0], res[1][0]]
-    beers.sort()
-    assert beers[0] == "Cooper's",\
-        'cursor.fetchall retrieved incorrect data, or data inserted incorrectly'
-    assert beers[1] == "Victoria Bitter",\
+    assert sorted(r[0] for r in res) == ["Cooper's", 'Victoria Bitter'],\
         'cursor.fetchall retrieved incorrect data, or data inserted incorrectly'
 
 
@@ -41,7 +48,7 @@ def test_execute_select_version(cubrid_db_cursor):
     cur, _ = cubrid_db_cursor
     cur.execute("SELECT VERSION()")
     row = cur.fetchone()
-    assert re.match(r'[0-9]+\.[0-9]+\.[0-9]+\.[0-9]{4}', row[0])
+    assert _VERSION_RE.match(row[0])
 
 
 def test_execute_insert(cubrid_db_cursor, exc_table):
@@ -93,6 +100,21 @@ def test_execute_error_statement(cubrid_db_cursor):
         cur.execute("error information")
 
 
+def test_execute_after_failed_prepare(cubrid_db_cursor, booze_table):
+    cur, _ = cubrid_db_cursor
+
+    query = f'select name from {booze_table}'
+    cur.execute(query)
+
+    with pytest.raises(cubrid_db.ProgrammingError, match = r'-493'):
+        cur.execute("error information")
+
+    # The failed prepare destroyed the request handle, so re-executing the
+    # earlier statement must re-prepare rather than trust the cached query
+    cur.execute(query)
+    assert cur.fetchall() == []
+
+
 def test_execute_empty_statement(cubrid_db_cursor):
     cur, _ = cubrid_db_cursor
     with pytest.raises(TypeError, match = r"missing 1 required positional argument"):
@@ -383,7 +405,7 @@ def test_rollback_extra_argument_error(cubrid_db_cursor, exc_rollback_table):
 def test_select_calculate_subselect(cubrid_db_cursor):
     cur, _ = cubrid_db_cursor
 
-    table_name = f"{TABLE_PREFIX}sctb"
+    table_name = SCTB_TABLE
 
     try:
         _drop_table(cubrid_db_cursor, table_name)
@@ -446,8 +468,8 @@ def test_select_calculate(cubrid_db_cursor):
 def test_trigger(cubrid_db_cursor):
     cur, _ = cubrid_db_cursor
 
-    hi = f"{TABLE_PREFIX}hi"
-    tt1 = f"{TABLE_PREFIX}tt1"
+    hi = HI_TABLE
+    tt1 = TT1_TABLE
 
     try:
         _drop_table(cubrid_db_cursor, hi)
@@ -7,11 +7,21 @@ import pytest
 from conftest import (
     BOOZE_SAMPLES,
     TABLE_PREFIX,
+    scratch_tables,
 )
 
 import cubrid_db
 
 
+# Today's date, read once for every row literal that needs it
+_TODAY = datetime.date.today()
+
+
+# Scratch tables shared across the datatype tests: one per distinct
+# column layout, reused between tests and dropped at module teardown
+_fetchall_table, _drop_fetchall_tables = scratch_tables(f'{TABLE_PREFIX}fetchall')
+
+
 @pytest.mark.xfail(reason="CCI does not return error when fetchall cannot return rows")
 def test_fetchall_error_no_rows(cubrid_db_cursor, booze_table):
     cur, _ = cubrid_db_cursor
@@ -23,7 +33,7 @@ def test_fetchall_error_no_rows(cubrid_db_cursor, booze_table):
         cur.fetchall()
 
     # or the insert query
-    cur.execute(f"insert into {booze_table} values ('Victoria Bitter')")
+    cur.execute(f"insert into {booze_table} values (?)", ('Victoria Bitter',))
     with pytest.raises(cubrid_db.Error):
         cur.fetchall()
 
@@ -47,9 +57,10 @@ def test_fetchall(cubrid_db_cursor, populated_booze_table):
     assert cur.rowcount in (-1, row_count)
     assert len(rows) == row_count, 'cursor.fetchall did not retrieve all rows'
 
-    rows = [r[0] for r in rows]
-    rows.sort()
-    assert rows == BOOZE_SAMPLES, 'cursor.fetchall retrieved incorrect rows'
+    # BOOZE_SAMPLES is defined in sorted order, so one sorted() call
+    # replaces the copy-then-sort-in-place dance
+    assert sorted(r[0] for r in rows) == BOOZE_SAMPLES, \
+        'cursor.fetchall retrieved incorrect rows'
 
     rows = cur.fetchall()
     assert not rows,\
@@ -72,20 +83,15 @@ def test_fetchall_empty_table(cubrid_db_cursor, populated_booze_table,
 
 
 def _test_fetchall_datatype(cur, columns_sql, rows, expected_rows = None):
-    table_name = f'{TABLE_PREFIX}fetchall'
+    table_name = _fetchall_table(cur, columns_sql)
     placeholders = ','.join(['?'] * len(rows[0]))
-    cur.execute(f'drop table if exists {table_name}')
-    try:
-        cur.execute(f"create table if not exists {table_name} ({columns_sql})")
-        cur.executemany(f"insert into {table_name} values ({placeholders})", rows)
-        assert cur.rowcount == 1
+    cur.executemany(f"insert into {table_name} values ({placeholders})", rows)
+    assert cur.rowcount == 1
 
-        cur.execute(f"select * from {table_name}")
-        fetched_rows = cur.fetchall()
-        expected_rows = expected_rows or rows
-        assert fetched_rows == expected_rows
-    finally:
-        cur.execute(f'drop table if exists {table_name}')
+    cur.execute(f"select * from {table_name}")
+    fetched_rows = cur.fetchall()
+    expected_rows = expected_rows or rows
+    assert fetched_rows == expected_rows
 
 
 def test_fetchall_int(cubrid_db_cursor):
@@ -140,7 +146,7 @@ def test_fetchall_string(cubrid_db_cursor):
 
 def test_fetchall_date(cubrid_db_cursor):
     cur, _ = cubrid_db_cursor
-    rows = [(x,) for x in [datetime.date.min, datetime.date.today(), datetime.date.max]]
+    rows = [(x,) for x in [datetime.date.min, _TODAY, datetime.date.max]]
     _test_fetchall_datatype(cur, 'c_date date', rows)
 
 
@@ -154,10 +160,12 @@ def test_fetchall_time(cubrid_db_cursor):
 
 def test_fetchall_datetime(cubrid_db_cursor):
     cur, _ = cubrid_db_cursor
-    rows = [(t,) for t in [datetime.datetime.now(), datetime.datetime.max]]
-    expected_rows = [(datetime.datetime(t.year, t.month, t.day,
-        t.hour, t.minute, t.second, t.microsecond // 1000 * 1000),)
-        for t in [datetime.datetime.now(), datetime.datetime.max]]
+    # Read the clock once: a second now() call for the expected rows
+    # would produce a different microsecond value than the one inserted
+    timestamps = [datetime.datetime.now(), datetime.datetime.max]
+    rows = [(t,) for t in timestamps]
+    expected_rows = [(t.replace(microsecond=t.microsecond // 1000 * 1000),)
+        for t in timestamps]
     _test_fetchall_datatype(cur, 'c_datetime datetime', rows, expected_rows)
 
 
@@ -177,9 +185,9 @@ def test_fetchall_varbit(cubrid_db_cursor):
 def test_fetchall_multiple_columns(cubrid_db_cursor):
     cur, _ = cubrid_db_cursor
     rows = [
-        (1400, 0.987654321, "ana has apples", datetime.date.today()),
-        (1500, 1.987654321, "bonny has oranges", datetime.date.today()),
-        (1600, 2.987654321, "chris has bananas", datetime.date.today()),
-        (2000, 3.987654321, "dora has pies", datetime.date.today()),
+        (1400, 0.987654321, "ana has apples", _TODAY),
+        (1500, 1.987654321, "bonny has oranges", _TODAY),
+        (1600, 2.987654321, "chris has bananas", _TODAY),
+        (2000, 3.987654321, "dora has pies", _TODAY),
     ]
     _test_fetchall_datatype(cur, 'c_int int, c_double double, c_varchar varchar, c_date date', rows)
@@ -1,6 +1,8 @@
 # pylint: disable=missing-function-docstring,missing-module-docstring
 import random
 
+from functools import lru_cache
+
 import pytest
 
 from conftest import BOOZE_SAMPLES
@@ -26,16 +28,20 @@ def test_fetchmany_default_array_size(cubrid_db_cursor, populated_booze_table):
         'default of array is one.'
 
 
+# Deterministic for a given (n, s) because the Random instance is seeded
+# with 0, so the parametrized test's repeated calls can be memoized; the
+# tuple return keeps the cached value immutable.
+@lru_cache(maxsize=None)
 def _gen_random_n_numbers_with_given_sum(n, s):
     if n <= 0 or s < n:
         raise ValueError("Impossible to distribute S among N numbers "
             "with each number being at least 1")
 
     if n == 1:
-        return [s]
+        return (s,)
 
     if s == n:
-        return [1] * n
+        return (1,) * n
 
     # Ensure there's at least 1 for each number
     remaining_sum = s - n
@@ -50,21 +56,21 @@ def _gen_random_n_numbers_with_given_sum(n, s):
         for i in range(1, n-1)] + [remaining_sum - partitions[-1]]
 
     # Add 1 back to each number to ensure the minimum value is 1
-    numbers = [x + 1 for x in numbers]
-
-    return numbers
+    return tuple(x + 1 for x in numbers)
 
 
-@pytest.mark.parametrize("array_size", list(range(1, 11, 2)))
+# Two arraysize values suffice: every fetchmany call below passes an
+# explicit size, which overrides arraysize, so the attribute only needs
+# to be shown harmless at its boundaries rather than swept in steps
+@pytest.mark.parametrize("array_size", [1, 10])
 @pytest.mark.parametrize("fetch_count", list(range(1, 4)))
 @pytest.mark.parametrize("attempted_row_count", [3, 6, 7, 9])
 def test_fetchmany(cubrid_db_cursor, populated_booze_table,
                    array_size, fetch_count, attempted_row_count):
     cur, _ = cubrid_db_cursor
 
-    if fetch_count > attempted_row_count:
-        return
-
+    # Every fetch_count (at most 3) is <= every attempted_row_count (at
+    # least 3), so no degenerate combination needs skipping
     cur.execute(f'select name from {populated_booze_table}')
 
     total_count = remaining_count = len(BOOZE_SAMPLES)